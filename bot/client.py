@@ -7,14 +7,26 @@ incoming responses are logged for debugging.
 
 from __future__ import annotations
 
-import hashlib
 import hmac
 import logging
+import socket
+import threading
 import time
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from typing import Any, Dict, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:  # Optional faster JSON decoder; both raise ValueError subclasses
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
 
 logger = logging.getLogger("bot.client")
 
@@ -23,6 +35,93 @@ BASE_URL = "https://demo-fapi.binance.com"
 
 # HTTP timeout in seconds
 REQUEST_TIMEOUT = 15
+# Pings are a liveness check, so they give up sooner than order requests
+PING_TIMEOUT = 5
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Transport-level retries.  Only GET is retried on 5xx responses: replaying
+# a POST could submit the same order twice.  Once retries run out the last
+# response is returned rather than raised, so ``_request`` still turns it
+# into a ``BinanceAPIError``.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+
+# TCP keepalive probing (seconds) so pooled connections survive idle gaps,
+# e.g. while the user sits at an interactive prompt
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 15
+
+_QS = "&".join
+
+# DEBUG templates for the request/response trace in ``_request``
+_REQ_FMT = "REQUEST  %s %s params=%s"
+_RESP_FMT = "RESPONSE %s %s status=%s body=%s"
+
+
+def _keepalive_socket_options() -> list:
+    """Return urllib3 socket options enabling TCP keepalive where supported."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL))
+    return options
+
+
+def _encode_query(params: Dict[str, Any]) -> str:
+    """Join *params* into a query string without percent-encoding.
+
+    Values must already be URL-safe: no ``&``, ``=``, ``+``, ``%`` or
+    spaces.  Symbols, enums, integers and fixed-point decimals all are, so
+    ``urlencode`` would only add overhead.
+    """
+    return _QS([f"{k}={v}" for k, v in params.items()])
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose pooled sockets have TCP keepalive enabled."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide ``requests.Session``, creating it on first use.
+
+    Sharing one session lets every ``BinanceClient`` reuse pooled
+    keep-alive connections instead of paying a fresh TCP/TLS handshake.
+    Credentials are sent per request, so the session holds no auth state.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.headers.update({
+                    "Content-Type": "application/x-www-form-urlencoded",
+                })
+                adapter = _KeepAliveAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=RETRY_POLICY,
+                )
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
 
 
 class BinanceAPIError(Exception):
@@ -58,28 +157,27 @@ class BinanceClient:
             raise ValueError("API key and secret must not be empty.")
         self._api_key = api_key
         self._api_secret = api_secret
+        self._secret_bytes = api_secret.encode("utf-8")
         self._base_url = base_url.rstrip("/")
-        self._session = requests.Session()
-        self._session.headers.update({
-            "X-MBX-APIKEY": self._api_key,
-            "Content-Type": "application/x-www-form-urlencoded",
-        })
+        self._session = _get_session()
+        self._headers = {"X-MBX-APIKEY": self._api_key}
 
     # ------------------------------------------------------------------
     # Authentication helpers
     # ------------------------------------------------------------------
 
-    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Add ``timestamp`` and ``signature`` to *params*."""
-        params["timestamp"] = int(time.time() * 1000)
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self._api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        params["signature"] = signature
-        return params
+    def _sign(self, query_string: str) -> bytes:
+        """Append ``timestamp`` and ``signature`` to *query_string*.
+
+        The query is encoded once; the same bytes feed the HMAC and become
+        the wire payload, guaranteeing what is signed is what is sent.
+        """
+        timestamp = f"timestamp={time.time_ns() // 1_000_000}"
+        query_string = f"{query_string}&{timestamp}" if query_string else timestamp
+        payload = query_string.encode("ascii")
+        # One-shot OpenSSL HMAC; no Python-level HMAC object per request
+        signature = hmac.digest(self._secret_bytes, payload, "sha256").hex()
+        return b"".join((payload, b"&signature=", signature.encode("ascii")))
 
     # ------------------------------------------------------------------
     # Generic HTTP helpers
@@ -89,11 +187,18 @@ class BinanceClient:
         self,
         method: str,
         path: str,
-        params: Optional[Dict[str, Any]] = None,
+        params: Union[Dict[str, Any], str, None] = None,
         signed: bool = False,
+        timeout: float = REQUEST_TIMEOUT,
     ) -> Dict[str, Any]:
         """Send an HTTP request and return the JSON response.
 
+        Signed POST requests carry the signed query string as the form body;
+        signed GETs append it to the URL.  In both cases ``requests`` receives
+        the exact string that was signed and does no re-encoding.  For signed
+        requests *params* may also be a pre-built query string.  Unsigned
+        requests pass *params* through as a dict.
+
         Raises
         ------
         BinanceAPIError
@@ -101,61 +206,93 @@ class BinanceClient:
         requests.RequestException
             On network-level failures.
         """
-        params = dict(params or {})
+        m = method.upper()
+        url = f"{self._base_url}{path}"
         if signed:
-            params = self._sign(params)
+            if not isinstance(params, str):
+                params = _encode_query(params or {})
+            payload: Any = self._sign(params)
+        else:
+            # Never mutated below, so the caller's dict is used as-is
+            payload = params or {}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_REQ_FMT, m, url, payload.decode("ascii") if signed else payload)
 
-        url = f"{self._base_url}{path}"
-        logger.debug("REQUEST  %s %s params=%s", method.upper(), url, params)
+        query: Optional[Dict[str, Any]] = None
+        body: Optional[bytes] = None
+        if not signed:
+            query = payload
+        elif m == "POST":
+            body = payload
+        else:
+            url = f"{url}?{payload.decode('ascii')}"
 
         response = self._session.request(
-            method, url, params=params, timeout=REQUEST_TIMEOUT
-        )
-
-        # Log raw response
-        logger.debug(
-            "RESPONSE %s %s status=%s body=%s",
-            method.upper(),
+            m,
             url,
-            response.status_code,
-            response.text[:2000],
+            params=query,
+            data=body,
+            headers=self._headers,
+            timeout=timeout,
         )
 
+        # Log raw response (skip decoding the body unless DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_RESP_FMT, m, url, response.status_code, response.text[:2000])
+
+        # Parse the body bytes exactly once, on whichever path we take
+        raw = response.content
+
         # Handle API-level errors
         if response.status_code >= 400:
             try:
-                body = response.json()
-                raise BinanceAPIError(
-                    status_code=response.status_code,
-                    code=body.get("code", -1),
-                    message=body.get("msg", response.text),
-                )
-            except (ValueError, KeyError):
+                err = _loads(raw)
+            except ValueError:
+                err = None
+            if not isinstance(err, dict):
                 raise BinanceAPIError(
                     status_code=response.status_code,
                     code=-1,
                     message=response.text,
                 )
+            raise BinanceAPIError(
+                status_code=response.status_code,
+                code=err.get("code", -1),
+                message=err["msg"] if "msg" in err else response.text,
+            )
 
-        return response.json()
+        return _loads(raw)
 
     # ------------------------------------------------------------------
     # Public endpoints
     # ------------------------------------------------------------------
 
-    def ping(self) -> bool:
+    def ping(self, timeout: float = PING_TIMEOUT) -> bool:
         """Test connectivity to the REST API.
 
         Returns ``True`` if the server responds with ``{}``.
         """
-        result = self._request("GET", "/fapi/v1/ping")
-        logger.info("Ping successful: %s", result)
+        result = self._request("GET", "/fapi/v1/ping", timeout=timeout)
+        logger.debug("Ping successful: %s", result)
         return result == {}
 
     # ------------------------------------------------------------------
     # Trading endpoints
     # ------------------------------------------------------------------
 
+    def post_signed(self, path: str, query_string: str) -> Dict[str, Any]:
+        """POST a pre-built query string to a signed endpoint.
+
+        *query_string* must already be in ``key=value&...`` form with
+        validated ASCII values; timestamp and signature are appended here.
+
+        Returns
+        -------
+        dict
+            The JSON response from Binance.
+        """
+        return self._request("POST", path, params=query_string, signed=True)
+
     def place_order(self, **kwargs: Any) -> Dict[str, Any]:
         """Place a new futures order (POST /fapi/v1/order).
 
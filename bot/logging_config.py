@@ -3,11 +3,23 @@
 Sets up dual logging: a rotating file handler for persistent logs and a
 console handler for real-time feedback.  All API requests, responses, and
 errors are captured at the appropriate level.
+
+Both handlers run on a background ``QueueListener`` thread; the ``bot``
+logger only enqueues records, so callers never block on disk or terminal
+I/O.  File records are additionally batched in a ``MemoryHandler`` and
+written in bulk, flushing immediately on ERROR.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "trading_bot.log")
@@ -16,6 +28,9 @@ LOG_FILE = os.path.join(LOG_DIR, "trading_bot.log")
 MAX_BYTES = 5 * 1024 * 1024
 BACKUP_COUNT = 3
 
+# Number of records buffered before the file handler is written to
+BUFFER_CAPACITY = 256
+
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
@@ -51,12 +66,30 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # --- Buffer file writes; ERROR and above flush straight through ---
+    buffered_file_handler = MemoryHandler(
+        BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(level)
 
     # --- Console handler (INFO and above) ---
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # --- Queue: the logger enqueues, the listener thread does the I/O ---
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # atexit runs LIFO: drain the queue first, then flush the buffer.
+    atexit.register(buffered_file_handler.flush)
+    atexit.register(listener.stop)
 
     return logger
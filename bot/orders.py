@@ -2,18 +2,59 @@
 
 Bridges validated ``OrderParams`` and the low-level ``BinanceClient``
 to submit MARKET and LIMIT orders with consistent logging.
+
+The order endpoint has a fixed schema, so request bodies are formatted
+straight from per-type templates instead of going through a dict.
+``make_order_sender`` goes one step further for bursts of same-shaped
+orders: the invariant prefix is built once and only the quantity varies.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
 
 from bot.client import BinanceClient
-from bot.validators import OrderParams
+from bot.validators import (
+    OrderParams,
+    validate_order_type,
+    validate_price,
+    validate_quantity,
+    validate_side,
+    validate_symbol,
+)
 
 logger = logging.getLogger("bot.orders")
 
+ORDER_PATH = "/fapi/v1/order"
+
+# Everything but the quantity, which is appended last.  Decimals are written
+# fixed-point: ``str(Decimal("1e1"))`` is ``1E+1``, and an unescaped ``+``
+# reads as a space in a form body.
+_MARKET_PREFIX = "symbol={}&side={}&type=MARKET&newOrderRespType=RESULT"
+_LIMIT_PREFIX = "symbol={}&side={}&type=LIMIT&price={:f}&timeInForce=GTC&newOrderRespType=RESULT"
+
+
+def _order_prefix(
+    symbol: str, side: str, order_type: str, price: Optional[Decimal] = None
+) -> str:
+    """Return the invariant part of an order query string."""
+    if order_type == "LIMIT":
+        return _LIMIT_PREFIX.format(symbol, side, price)
+    return _MARKET_PREFIX.format(symbol, side)
+
+
+def _log_response(response: Dict[str, Any]) -> None:
+    """Log the key fields of an order response."""
+    logger.info(
+        "Order response: orderId=%s status=%s executedQty=%s avgPrice=%s",
+        response.get("orderId"),
+        response.get("status"),
+        response.get("executedQty"),
+        response.get("avgPrice"),
+    )
+
 
 def place_order(client: BinanceClient, params: OrderParams) -> Dict[str, Any]:
     """Build the order payload, submit it, and return the API response.
@@ -37,17 +78,7 @@ def place_order(client: BinanceClient, params: OrderParams) -> Dict[str, Any]:
     requests.RequestException
         On network-level failures.
     """
-    payload: Dict[str, Any] = {
-        "symbol": params.symbol,
-        "side": params.side,
-        "type": params.order_type,
-        "quantity": str(params.quantity),
-        "newOrderRespType": "RESULT",
-    }
-
-    if params.order_type == "LIMIT":
-        payload["price"] = str(params.price)
-        payload["timeInForce"] = "GTC"
+    prefix = _order_prefix(params.symbol, params.side, params.order_type, params.price)
 
     logger.info(
         "Placing %s %s order: symbol=%s qty=%s%s",
@@ -58,14 +89,44 @@ def place_order(client: BinanceClient, params: OrderParams) -> Dict[str, Any]:
         f" price={params.price}" if params.price else "",
     )
 
-    response = client.place_order(**payload)
+    response = client.post_signed(ORDER_PATH, f"{prefix}&quantity={params.quantity:f}")
+    _log_response(response)
+    return response
+
 
-    logger.info(
-        "Order response: orderId=%s status=%s executedQty=%s avgPrice=%s",
-        response.get("orderId"),
-        response.get("status"),
-        response.get("executedQty"),
-        response.get("avgPrice"),
-    )
+def make_order_sender(
+    client: BinanceClient,
+    symbol: str,
+    side: str,
+    order_type: str,
+    price: str | float | Decimal | None = None,
+) -> Callable[[str | float | Decimal], Dict[str, Any]]:
+    """Return a ``send(quantity)`` callable for repeated same-shaped orders.
 
-    return response
+    Symbol, side, type and price are validated and formatted once; each
+    call then only validates the quantity, appends it, and submits.
+
+    Raises
+    ------
+    ValidationError
+        If any fixed parameter is invalid (at construction) or a quantity
+        is invalid (per call).
+    """
+    v_symbol = validate_symbol(symbol)
+    v_side = validate_side(side)
+    v_type = validate_order_type(order_type)
+    v_price = validate_price(price, v_type)
+    prefix = _order_prefix(v_symbol, v_side, v_type, v_price)
+    price_note = f" price={v_price}" if v_price else ""
+    post_signed = client.post_signed
+
+    def send(quantity: str | float | Decimal) -> Dict[str, Any]:
+        qty = validate_quantity(quantity)
+        logger.info(
+            "Placing %s %s order: symbol=%s qty=%s%s", v_side, v_type, v_symbol, qty, price_note
+        )
+        response = post_signed(ORDER_PATH, f"{prefix}&quantity={qty:f}")
+        _log_response(response)
+        return response
+
+    return send
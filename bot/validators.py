@@ -6,14 +6,19 @@ order-placement layer can rely on sanitised, well-typed data.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Optional
 
 VALID_SIDES = {"BUY", "SELL"}
 VALID_ORDER_TYPES = {"MARKET", "LIMIT"}
-SYMBOL_PATTERN = re.compile(r"^[A-Z]{2,20}$")
+SYMBOL_MIN_LEN = 2
+SYMBOL_MAX_LEN = 20
+
+# The string validators are pure, so results are memoised; invalid input
+# raises and is therefore never cached.
+VALIDATION_CACHE_SIZE = 256
 
 
 class ValidationError(Exception):
@@ -31,16 +36,23 @@ class OrderParams:
     price: Optional[Decimal] = None
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_symbol(symbol: str) -> str:
     """Return the uppercased symbol or raise on invalid format."""
     symbol = symbol.strip().upper()
-    if not SYMBOL_PATTERN.match(symbol):
+    # Equivalent to ^[A-Z]{2,20}$ once uppercased, without the regex engine
+    if not (
+        SYMBOL_MIN_LEN <= len(symbol) <= SYMBOL_MAX_LEN
+        and symbol.isascii()
+        and symbol.isalpha()
+    ):
         raise ValidationError(
             f"Invalid symbol '{symbol}'. Must be 2-20 uppercase letters (e.g. BTCUSDT)."
         )
     return symbol
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_side(side: str) -> str:
     """Return the uppercased side or raise if not BUY/SELL."""
     side = side.strip().upper()
@@ -49,6 +61,7 @@ def validate_side(side: str) -> str:
     return side
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_order_type(order_type: str) -> str:
     """Return the uppercased order type or raise if unsupported."""
     order_type = order_type.strip().upper()
@@ -59,10 +72,23 @@ def validate_order_type(order_type: str) -> str:
     return order_type
 
 
-def validate_quantity(quantity: str | float) -> Decimal:
+def _to_decimal(value: str | float | Decimal) -> Decimal:
+    """Convert *value* to ``Decimal``, only stringifying floats.
+
+    Raises ``InvalidOperation``/``ValueError`` on malformed input.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, str):
+        return Decimal(value)
+    # Going through str() avoids binary-float noise (0.1 -> 0.1000000000000000055...)
+    return Decimal(str(value))
+
+
+def validate_quantity(quantity: str | float | Decimal) -> Decimal:
     """Return a positive Decimal quantity or raise."""
     try:
-        qty = Decimal(str(quantity))
+        qty = _to_decimal(quantity)
     except (InvalidOperation, ValueError):
         raise ValidationError(f"Invalid quantity '{quantity}'. Must be a positive number.")
     if qty <= 0:
@@ -70,13 +96,13 @@ def validate_quantity(quantity: str | float) -> Decimal:
     return qty
 
 
-def validate_price(price: str | float | None, order_type: str) -> Optional[Decimal]:
+def validate_price(price: str | float | Decimal | None, order_type: str) -> Optional[Decimal]:
     """Return a positive Decimal price (required for LIMIT) or None."""
     if order_type == "LIMIT":
         if price is None:
             raise ValidationError("Price is required for LIMIT orders.")
         try:
-            p = Decimal(str(price))
+            p = _to_decimal(price)
         except (InvalidOperation, ValueError):
             raise ValidationError(f"Invalid price '{price}'. Must be a positive number.")
         if p <= 0:
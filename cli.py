@@ -13,27 +13,60 @@ Supports two modes:
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import sys
-
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional
 
 from bot.client import BinanceAPIError, BinanceClient
 from bot.logging_config import setup_logging
 from bot.orders import place_order
 from bot.validators import ValidationError, validate_order
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 # ---------------------------------------------------------------------------
 # Initialisation
 # ---------------------------------------------------------------------------
+#
+# ``rich`` and ``dotenv`` are imported lazily: scripted ``ping``/``order``
+# runs should not pay for modules they may never touch.
 
-load_dotenv()
 logger = setup_logging()
-console = Console()
+_console: Optional[Console] = None
+_status_console: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _get_status_console() -> Console:
+    """Return the console for prompts, progress and error messages.
+
+    This is the stdout console on a terminal; when stdout is piped it is a
+    stderr console so that stdout carries only the JSON output.
+    """
+    global _status_console
+    if _status_console is None:
+        console = _get_console()
+        if console.is_terminal:
+            _status_console = console
+        else:
+            from rich.console import Console
+
+            _status_console = Console(stderr=True)
+    return _status_console
+
 
 BANNER = r"""
  ____  _                              ____        _
@@ -50,7 +83,7 @@ def _get_client() -> BinanceClient:
     api_key = os.getenv("BINANCE_API_KEY") or os.getenv("BINANCE_TESTNET_API_KEY", "")
     api_secret = os.getenv("BINANCE_API_SECRET") or os.getenv("BINANCE_TESTNET_API_SECRET", "")
     if not api_key or not api_secret:
-        console.print(
+        _get_status_console().print(
             "[bold red]Error:[/] API credentials not found. Set BINANCE_API_KEY and "
             "BINANCE_API_SECRET (or BINANCE_TESTNET_API_KEY / BINANCE_TESTNET_API_SECRET).\n"
             "Copy .env.example to .env and fill in your testnet credentials."
@@ -59,13 +92,49 @@ def _get_client() -> BinanceClient:
     return BinanceClient(api_key=api_key, api_secret=api_secret)
 
 
+def _ping_in_background(client: BinanceClient) -> Future:
+    """Start ``client.ping()`` on a daemon thread and return its future.
+
+    Lets the connectivity round-trip overlap with the confirmation prompt.
+    A daemon thread is used so a cancelled order never waits on the ping.
+    """
+    future: Future = Future()
+
+    def _run() -> None:
+        try:
+            future.set_result(client.ping())
+        except Exception as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, name="ping", daemon=True).start()
+    return future
+
+
 # ---------------------------------------------------------------------------
 # Output helpers
 # ---------------------------------------------------------------------------
 
 
 def _print_order_summary(params) -> None:
-    """Pretty-print the order request before sending."""
+    """Pretty-print the order request before sending.
+
+    When stdout is not a terminal the summary is emitted as one JSON line.
+    """
+    console = _get_console()
+    if not console.is_terminal:
+        summary = {
+            "symbol": params.symbol,
+            "side": params.side,
+            "type": params.order_type,
+            "quantity": str(params.quantity),
+        }
+        if params.price is not None:
+            summary["price"] = str(params.price)
+        print(json.dumps(summary))
+        return
+
+    from rich.table import Table
+
     table = Table(title="Order Request Summary", show_header=False, border_style="cyan")
     table.add_column("Field", style="bold")
     table.add_column("Value")
@@ -80,7 +149,17 @@ def _print_order_summary(params) -> None:
 
 
 def _print_order_response(resp: dict) -> None:
-    """Pretty-print the order response from Binance."""
+    """Pretty-print the order response from Binance.
+
+    When stdout is not a terminal the raw response is emitted as JSON.
+    """
+    console = _get_console()
+    if not console.is_terminal:
+        print(json.dumps(resp))
+        return
+
+    from rich.table import Table
+
     table = Table(title="Order Response", show_header=False, border_style="green")
     table.add_column("Field", style="bold")
     table.add_column("Value")
@@ -120,6 +199,10 @@ def _print_order_response(resp: dict) -> None:
 
 def _execute_order(symbol: str, side: str, order_type: str, quantity, price=None) -> None:
     """Validate, confirm, submit, and display an order."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    console = _get_status_console()
     try:
         params = validate_order(symbol, side, order_type, quantity, price)
     except ValidationError as exc:
@@ -129,17 +212,19 @@ def _execute_order(symbol: str, side: str, order_type: str, quantity, price=None
 
     _print_order_summary(params)
 
+    client = _get_client()
+
+    # Connectivity check runs while the user reads the summary
+    ping = _ping_in_background(client)
+
     # Ask for confirmation in interactive/direct mode
-    if not Confirm.ask("\n[bold]Submit this order?[/]", default=False):
+    if not Confirm.ask("\n[bold]Submit this order?[/]", default=False, console=console):
         console.print("[yellow]Order cancelled by user.[/]")
         return
 
-    client = _get_client()
-
-    # Connectivity check
     console.print("\n[dim]Testing API connectivity...[/]", end=" ")
     try:
-        client.ping()
+        ping.result()
         console.print("[green]OK[/]")
     except Exception as exc:
         console.print(f"[red]FAILED[/]")
@@ -160,7 +245,8 @@ def _execute_order(symbol: str, side: str, order_type: str, quantity, price=None
         sys.exit(1)
 
     _print_order_response(response)
-    console.print(Panel("[bold green]Order submitted successfully![/]", border_style="green"))
+    if console.is_terminal:
+        console.print(Panel("[bold green]Order submitted successfully![/]", border_style="green"))
 
 
 # ---------------------------------------------------------------------------
@@ -181,16 +267,20 @@ def cmd_order(args: argparse.Namespace) -> None:
 
 def cmd_interactive(_args: argparse.Namespace) -> None:
     """Handle the ``interactive`` sub-command — guided prompt wizard."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    console = _get_status_console()
     console.print(Panel(BANNER, border_style="bright_blue", expand=False))
 
-    symbol = Prompt.ask("[bold]Symbol[/]", default="BTCUSDT")
-    side = Prompt.ask("[bold]Side[/]", choices=["BUY", "SELL"], default="BUY")
-    order_type = Prompt.ask("[bold]Order type[/]", choices=["MARKET", "LIMIT"], default="MARKET")
-    quantity = Prompt.ask("[bold]Quantity[/]")
+    symbol = Prompt.ask("[bold]Symbol[/]", default="BTCUSDT", console=console)
+    side = Prompt.ask("[bold]Side[/]", choices=["BUY", "SELL"], default="BUY", console=console)
+    order_type = Prompt.ask("[bold]Order type[/]", choices=["MARKET", "LIMIT"], default="MARKET", console=console)
+    quantity = Prompt.ask("[bold]Quantity[/]", console=console)
 
     price = None
     if order_type == "LIMIT":
-        price = Prompt.ask("[bold]Price[/]")
+        price = Prompt.ask("[bold]Price[/]", console=console)
 
     _execute_order(symbol=symbol, side=side, order_type=order_type, quantity=quantity, price=price)
 
@@ -198,6 +288,7 @@ def cmd_interactive(_args: argparse.Namespace) -> None:
 def cmd_ping(_args: argparse.Namespace) -> None:
     """Handle the ``ping`` sub-command — test API connectivity."""
     client = _get_client()
+    console = _get_console()
     try:
         client.ping()
         console.print("[bold green]Binance Futures Testnet is reachable.[/]")
@@ -253,6 +344,9 @@ def main() -> None:
         parser.print_help()
         sys.exit(0)
 
+    from dotenv import load_dotenv
+
+    load_dotenv()
     args.func(args)
 
 
@@ -7,25 +7,48 @@ Launch with:
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
-import threading
+import time
 import tkinter as tk
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING, Callable
 
-from dotenv import load_dotenv
-
-from bot.client import BinanceAPIError, BinanceClient
 from bot.logging_config import setup_logging
-from bot.orders import place_order
 from bot.validators import ValidationError, validate_order
 
+if TYPE_CHECKING:
+    from bot.client import BinanceClient
+
 # ---------------------------------------------------------------------------
 # Initialisation
 # ---------------------------------------------------------------------------
+#
+# Nothing touches disk or imports the HTTP stack at import time: ``.env``
+# and logging are set up by ``_init_env()``, and ``bot.client`` /
+# ``bot.orders`` (which pull in ``requests``) load on first network use.
+
+
+@functools.cache
+def _init_env() -> logging.Logger:
+    """Load ``.env`` and configure logging, exactly once."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return setup_logging()
+
+
+@functools.cache
+def _credentials() -> tuple[str, str]:
+    """Return ``(api_key, api_secret)``, resolved once after ``.env`` loads."""
+    _init_env()
+    api_key = os.getenv("BINANCE_API_KEY") or os.getenv("BINANCE_TESTNET_API_KEY", "")
+    api_secret = os.getenv("BINANCE_API_SECRET") or os.getenv("BINANCE_TESTNET_API_SECRET", "")
+    return api_key, api_secret
 
-load_dotenv()
-logger = setup_logging()
 
 # ---------------------------------------------------------------------------
 # Colour palette
@@ -43,11 +66,76 @@ YELLOW = "#f9e2af"
 BORDER = "#45475a"
 ENTRY_BG = "#3b3b58"
 
+# ---------------------------------------------------------------------------
+# ttk styles
+# ---------------------------------------------------------------------------
+
+FONT = ("Segoe UI", 10)
+FONT_SMALL = ("Segoe UI", 9)
+BUTTON_FG = "#1e1e2e"
+
+STYLES: dict[str, dict] = {
+    ".": {"background": BG, "foreground": FG, "fieldbackground": ENTRY_BG},
+    "TFrame": {"background": BG},
+    "Card.TFrame": {"background": BG_CARD},
+    # Labels
+    "TLabel": {"background": BG, "foreground": FG, "font": FONT},
+    "Card.TLabel": {"background": BG_CARD, "foreground": FG, "font": FONT},
+    "Header.TLabel": {"background": BG, "foreground": ACCENT, "font": ("Segoe UI", 18, "bold")},
+    "Sub.TLabel": {"background": BG, "foreground": FG_DIM, "font": FONT_SMALL},
+    "Status.TLabel": {"background": BG_CARD, "foreground": FG_DIM, "font": FONT_SMALL},
+    "SectionTitle.TLabel": {"background": BG, "foreground": ACCENT, "font": ("Segoe UI", 11, "bold")},
+    # Buttons
+    "Accent.TButton": {
+        "background": ACCENT,
+        "foreground": BUTTON_FG,
+        "font": ("Segoe UI", 10, "bold"),
+        "padding": (16, 8),
+    },
+    "Buy.TButton": {
+        "background": GREEN,
+        "foreground": BUTTON_FG,
+        "font": ("Segoe UI", 11, "bold"),
+        "padding": (20, 10),
+    },
+    "Sell.TButton": {
+        "background": RED,
+        "foreground": BUTTON_FG,
+        "font": ("Segoe UI", 11, "bold"),
+        "padding": (20, 10),
+    },
+    "Ping.TButton": {"background": BG_CARD, "foreground": ACCENT, "font": FONT_SMALL, "padding": (8, 4)},
+    # Combobox / Entry
+    "TCombobox": {"fieldbackground": ENTRY_BG, "foreground": FG, "padding": 6},
+    "TEntry": {"fieldbackground": ENTRY_BG, "foreground": FG, "padding": 6},
+    # Radio buttons
+    "Side.TRadiobutton": {"background": BG_CARD, "foreground": FG, "font": FONT},
+}
+
+STYLE_MAPS: dict[str, dict] = {
+    "Accent.TButton": {"background": [("active", "#74a0e3"), ("disabled", BORDER)]},
+    "Buy.TButton": {"background": [("active", "#8cd694"), ("disabled", BORDER)]},
+    "Sell.TButton": {"background": [("active", "#e07a96"), ("disabled", BORDER)]},
+    "Ping.TButton": {"background": [("active", BG_SECONDARY)]},
+    "TCombobox": {"fieldbackground": [("readonly", ENTRY_BG)]},
+    "Side.TRadiobutton": {"background": [("active", BG_CARD)]},
+}
+
+# Log lines are queued and written to the Text widget in one batch per tick
+LOG_FLUSH_MS = 50
+# Oldest lines beyond this are trimmed to bound memory and insert cost
+MAX_LOG_LINES = 2000
+
+# Background heartbeat: keeps the pooled connection warm and the status
+# indicator current between user actions
+PING_INTERVAL_MS = 30_000
+
 
 def _get_client() -> BinanceClient:
-    """Build an authenticated BinanceClient from environment variables."""
-    api_key = os.getenv("BINANCE_API_KEY") or os.getenv("BINANCE_TESTNET_API_KEY", "")
-    api_secret = os.getenv("BINANCE_API_SECRET") or os.getenv("BINANCE_TESTNET_API_SECRET", "")
+    """Build an authenticated BinanceClient from the resolved credentials."""
+    from bot.client import BinanceClient
+
+    api_key, api_secret = _credentials()
     if not api_key or not api_secret:
         raise ValueError(
             "API credentials not found.\n"
@@ -56,6 +144,16 @@ def _get_client() -> BinanceClient:
     return BinanceClient(api_key=api_key, api_secret=api_secret)
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_client() -> BinanceClient:
+    """Return the process-wide client, built on first successful call.
+
+    Failures (e.g. missing credentials) raise and are not cached, but
+    ``_credentials`` is, so changed credentials need a restart.
+    """
+    return _get_client()
+
+
 # ╔═══════════════════════════════════════════════════════════════════════════╗
 # ║  Main Application Window                                                 ║
 # ╚═══════════════════════════════════════════════════════════════════════════╝
@@ -64,6 +162,21 @@ def _get_client() -> BinanceClient:
 class TradingBotGUI:
     """Main GUI window for the trading bot."""
 
+    # Response fields shown in the order log, in display order
+    _ORDER_FIELDS = (
+        ("Order ID", "orderId"),
+        ("Status", "status"),
+        ("Symbol", "symbol"),
+        ("Side", "side"),
+        ("Type", "type"),
+        ("Orig Qty", "origQty"),
+        ("Executed Qty", "executedQty"),
+        ("Avg Price", "avgPrice"),
+        ("Time In Force", "timeInForce"),
+    )
+    _GOOD_STATUSES = frozenset(("NEW", "FILLED", "PARTIALLY_FILLED"))
+    _SEPARATOR = "—" * 50
+
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.root.title("Binance Futures Testnet — Trading Bot")
@@ -80,12 +193,29 @@ class TradingBotGUI:
 
         self._client: BinanceClient | None = None
         self._connected = False
+        # Set while a ping is queued or running; extra pings are folded into
+        # it.  _ping_quiet is read when the result arrives, so a manual click
+        # during a heartbeat still gets a status update and log line.
+        self._ping_in_flight = False
+        self._ping_quiet = False
+
+        # Warm worker threads shared by pings and order submissions
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Pending (text, tag) chunks for the order log, flushed in batches
+        self._pending_log: deque[tuple[str, str]] = deque()
+        self._flush_scheduled = False
+        # Log timestamp cache: lines within the same second share one string
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
 
         self._build_styles()
         self._build_ui()
 
-        # Try to connect on launch
+        # Try to connect on launch, then keep checking in the background
         self.root.after(300, self._ping_async)
+        self.root.after(PING_INTERVAL_MS, self._heartbeat)
 
     # ------------------------------------------------------------------
     # ttk styles
@@ -94,68 +224,20 @@ class TradingBotGUI:
     def _build_styles(self) -> None:
         style = ttk.Style()
         style.theme_use("clam")
-
-        style.configure(".", background=BG, foreground=FG, fieldbackground=ENTRY_BG)
-        style.configure("TFrame", background=BG)
-        style.configure("Card.TFrame", background=BG_CARD)
-        style.configure("TLabel", background=BG, foreground=FG, font=("Segoe UI", 10))
-        style.configure("Card.TLabel", background=BG_CARD, foreground=FG, font=("Segoe UI", 10))
-        style.configure("Header.TLabel", background=BG, foreground=ACCENT, font=("Segoe UI", 18, "bold"))
-        style.configure("Sub.TLabel", background=BG, foreground=FG_DIM, font=("Segoe UI", 9))
-        style.configure("Status.TLabel", background=BG_CARD, foreground=FG_DIM, font=("Segoe UI", 9))
-        style.configure("SectionTitle.TLabel", background=BG, foreground=ACCENT, font=("Segoe UI", 11, "bold"))
-
-        # Buttons
-        style.configure(
-            "Accent.TButton",
-            background=ACCENT,
-            foreground="#1e1e2e",
-            font=("Segoe UI", 10, "bold"),
-            padding=(16, 8),
-        )
-        style.map("Accent.TButton", background=[("active", "#74a0e3"), ("disabled", BORDER)])
-
-        style.configure(
-            "Buy.TButton",
-            background=GREEN,
-            foreground="#1e1e2e",
-            font=("Segoe UI", 11, "bold"),
-            padding=(20, 10),
-        )
-        style.map("Buy.TButton", background=[("active", "#8cd694"), ("disabled", BORDER)])
-
-        style.configure(
-            "Sell.TButton",
-            background=RED,
-            foreground="#1e1e2e",
-            font=("Segoe UI", 11, "bold"),
-            padding=(20, 10),
-        )
-        style.map("Sell.TButton", background=[("active", "#e07a96"), ("disabled", BORDER)])
-
-        style.configure(
-            "Ping.TButton",
-            background=BG_CARD,
-            foreground=ACCENT,
-            font=("Segoe UI", 9),
-            padding=(8, 4),
-        )
-        style.map("Ping.TButton", background=[("active", BG_SECONDARY)])
-
-        # Combobox / Entry
-        style.configure("TCombobox", fieldbackground=ENTRY_BG, foreground=FG, padding=6)
-        style.map("TCombobox", fieldbackground=[("readonly", ENTRY_BG)])
-        style.configure("TEntry", fieldbackground=ENTRY_BG, foreground=FG, padding=6)
-
-        # Radio buttons
-        style.configure("Side.TRadiobutton", background=BG_CARD, foreground=FG, font=("Segoe UI", 10))
-        style.map("Side.TRadiobutton", background=[("active", BG_CARD)])
+        for name, options in STYLES.items():
+            style.configure(name, **options)
+        for name, options in STYLE_MAPS.items():
+            style.map(name, **options)
 
     # ------------------------------------------------------------------
     # UI construction
     # ------------------------------------------------------------------
 
     def _build_ui(self) -> None:
+        # Keep the window unmapped while building so it is mapped once,
+        # fully laid out, instead of re-laying out per widget
+        self.root.withdraw()
+
         # ── Header ──
         header_frame = ttk.Frame(self.root)
         header_frame.pack(fill="x", padx=20, pady=(18, 0))
@@ -166,7 +248,7 @@ class TradingBotGUI:
         conn_frame.pack(side="right")
         self._status_dot = tk.Canvas(conn_frame, width=12, height=12, bg=BG, highlightthickness=0)
         self._status_dot.pack(side="left", padx=(0, 6))
-        self._draw_dot(FG_DIM)
+        self._dot_id = self._status_dot.create_oval(2, 2, 10, 10, fill=FG_DIM, outline=FG_DIM)
         self._status_label = ttk.Label(conn_frame, text="Checking...", style="Sub.TLabel")
         self._status_label.pack(side="left")
         ttk.Button(conn_frame, text="Ping", style="Ping.TButton", command=self._ping_async).pack(
@@ -199,11 +281,21 @@ class TradingBotGUI:
         side_frame = ttk.Frame(form, style="Card.TFrame")
         side_frame.grid(row=1, column=1, sticky="w", padx=(12, 0), pady=(0, 8))
         self._side_var = tk.StringVar(value="BUY")
-        ttk.Radiobutton(side_frame, text="BUY", variable=self._side_var, value="BUY", style="Side.TRadiobutton").pack(
-            side="left", padx=(0, 16)
-        )
         ttk.Radiobutton(
-            side_frame, text="SELL", variable=self._side_var, value="SELL", style="Side.TRadiobutton"
+            side_frame,
+            text="BUY",
+            variable=self._side_var,
+            value="BUY",
+            style="Side.TRadiobutton",
+            command=self._on_side_changed,
+        ).pack(side="left", padx=(0, 16))
+        ttk.Radiobutton(
+            side_frame,
+            text="SELL",
+            variable=self._side_var,
+            value="SELL",
+            style="Side.TRadiobutton",
+            command=self._on_side_changed,
         ).pack(side="left")
 
         # Row 2 — Order type
@@ -232,6 +324,7 @@ class TradingBotGUI:
         self._price_var = tk.StringVar()
         self._price_entry = ttk.Entry(form, textvariable=self._price_var, width=20)
         self._price_entry.grid(row=4, column=1, sticky="w", padx=(12, 0), pady=(0, 4))
+        self._price_state = "normal"  # ttk.Entry default; tracked to skip no-op updates
         self._toggle_price_field()
 
         # Configure grid weights so form stretches
@@ -243,8 +336,9 @@ class TradingBotGUI:
 
         self._submit_btn = ttk.Button(btn_frame, text="PLACE ORDER", style="Buy.TButton", command=self._submit_order)
         self._submit_btn.pack(fill="x")
-        # Dynamically colour the button via side var
-        self._side_var.trace_add("write", self._on_side_changed)
+        # Side the button was last styled for; None until the first pick
+        # so the generic "PLACE ORDER" label is replaced on first click
+        self._last_side: str | None = None
 
         # ── Separator ──
         ttk.Separator(self.root).pack(fill="x", padx=20, pady=(16, 0))
@@ -284,41 +378,139 @@ class TradingBotGUI:
         self._log_text.tag_configure("label", foreground=FG_DIM)
         self._log_text.tag_configure("value", foreground=FG)
 
+        self.root.update_idletasks()
+        self.root.deiconify()
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     def _draw_dot(self, colour: str) -> None:
-        self._status_dot.delete("all")
-        self._status_dot.create_oval(2, 2, 10, 10, fill=colour, outline=colour)
+        self._status_dot.itemconfigure(self._dot_id, fill=colour, outline=colour)
 
     def _log(self, message: str, tag: str = "info") -> None:
-        """Append a line to the order-log text widget."""
-        self._log_text.configure(state="normal")
-        ts = datetime.now().strftime("%H:%M:%S")
-        self._log_text.insert("end", f"[{ts}] ", "timestamp")
-        self._log_text.insert("end", f"{message}\n", tag)
-        self._log_text.see("end")
-        self._log_text.configure(state="disabled")
+        """Queue a line for the order-log text widget."""
+        self._pending_log.append((f"[{self._timestamp()}] ", "timestamp"))
+        self._pending_log.append((f"{message}\n", tag))
+        self._schedule_flush()
+
+    def _timestamp(self) -> str:
+        """Return the current ``HH:MM:SS``, reformatting at most once a second."""
+        now = time.time()
+        sec = int(now)
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._last_ts_str
 
     def _log_kv(self, label: str, value: str, tag: str = "value") -> None:
-        """Append a key-value pair to the log."""
+        """Queue a key-value pair for the log."""
+        self._pending_log.append((f"  {label}: ", "label"))
+        self._pending_log.append((f"{value}\n", tag))
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write all queued log chunks to the Text widget in one pass.
+
+        Do not add an explicit ``update()`` here or in callers: it re-enters
+        the event loop.  Use ``update_idletasks()`` if a redraw must happen
+        before blocking.
+        """
+        self._flush_scheduled = False
+        if not self._pending_log:
+            return
+        # Text.insert accepts interleaved (chars, tags) pairs, so the whole
+        # batch goes to Tcl in a single call
+        args: list[str] = []
+        for text, tag in self._pending_log:
+            args += (text, tag)
+        self._pending_log.clear()
+
+        # Only follow new output if the view was already at the bottom, so
+        # users reading history are not yanked back down
+        follow = self._log_text.yview()[1] > 0.98
+
         self._log_text.configure(state="normal")
-        self._log_text.insert("end", f"  {label}: ", "label")
-        self._log_text.insert("end", f"{value}\n", tag)
-        self._log_text.see("end")
+        self._log_text.insert("end", *args)
+        # Every entry ends in a newline, so the last line is always empty
+        lines = int(self._log_text.index("end-1c").split(".")[0]) - 1
+        excess = lines - MAX_LOG_LINES
+        if excess > 0:
+            self._log_text.delete("1.0", f"{excess + 1}.0")
         self._log_text.configure(state="disabled")
+        if follow:
+            self._log_text.see("end")
+
+    def _confirm_dialog(
+        self,
+        title: str,
+        body: str,
+        on_confirm: Callable[[], None],
+        on_cancel: Callable[[], None],
+    ) -> None:
+        """Show an OK/Cancel dialog without blocking the event loop.
+
+        Unlike ``messagebox.askokcancel`` this returns immediately and the
+        chosen callback runs from the button handler.  A local grab keeps
+        input on the dialog while ping and order callbacks keep running.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.configure(bg=BG)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+
+        frame = ttk.Frame(dialog, padding=16)
+        frame.pack(fill="both", expand=True)
+        ttk.Label(frame, text=body, justify="left").pack(anchor="w")
+        buttons = ttk.Frame(frame)
+        buttons.pack(fill="x", pady=(14, 0))
+
+        def close(callback: Callable[[], None]) -> None:
+            dialog.grab_release()
+            dialog.destroy()
+            callback()
+
+        cancel_btn = ttk.Button(buttons, text="Cancel", style="Ping.TButton", command=lambda: close(on_cancel))
+        cancel_btn.pack(side="right")
+        ok_btn = ttk.Button(buttons, text="OK", style="Accent.TButton", command=lambda: close(on_confirm))
+        ok_btn.pack(side="right", padx=(0, 8))
+        # Return activates whichever button has focus, so tabbing to Cancel
+        # and pressing Return cancels rather than placing the order
+        for button in (ok_btn, cancel_btn):
+            button.bind("<Return>", lambda event: event.widget.invoke())
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(on_cancel))
+        dialog.bind("<Escape>", lambda _event: close(on_cancel))
+
+        # A grab needs a viewable window; this only waits for the map
+        dialog.wait_visibility()
+        dialog.grab_set()
+        ok_btn.focus_set()
 
     def _toggle_price_field(self) -> None:
         is_limit = self._type_var.get() == "LIMIT"
         state = "normal" if is_limit else "disabled"
+        if state == self._price_state:
+            return
+        self._price_state = state
         self._price_entry.configure(state=state)
-        if not is_limit:
+        if not is_limit and self._price_var.get():
             self._price_var.set("")
 
+    def _set_status(self, text: str) -> None:
+        # Skip no-op configures; they still trigger a ttk style lookup
+        if str(self._status_label.cget("text")) != text:
+            self._status_label.configure(text=text)
+
     def _set_busy(self, busy: bool) -> None:
         state = "disabled" if busy else "normal"
-        self._submit_btn.configure(state=state)
+        if str(self._submit_btn.cget("state")) != state:
+            self._submit_btn.configure(state=state)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -327,62 +519,99 @@ class TradingBotGUI:
     def _on_type_changed(self, _event=None) -> None:
         self._toggle_price_field()
 
-    def _on_side_changed(self, *_args) -> None:
+    def _on_close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _on_side_changed(self) -> None:
+        """Recolour and relabel the submit button for the selected side."""
         side = self._side_var.get()
+        if side == self._last_side:
+            return
+        self._last_side = side
         style = "Buy.TButton" if side == "BUY" else "Sell.TButton"
-        label = f"PLACE {side} ORDER"
-        self._submit_btn.configure(style=style, text=label)
+        self._submit_btn.configure(style=style, text=f"PLACE {side} ORDER")
 
     # ------------------------------------------------------------------
     # Ping
     # ------------------------------------------------------------------
 
-    def _ping_async(self) -> None:
-        self._status_label.configure(text="Connecting...")
-        self._draw_dot(YELLOW)
-        threading.Thread(target=self._ping_worker, daemon=True).start()
+    def _ping_async(self, quiet: bool = False) -> None:
+        if self._ping_in_flight:
+            # Upgrade an in-flight heartbeat to a manual ping
+            if quiet or not self._ping_quiet:
+                return
+        else:
+            self._ping_in_flight = True
+            self._executor.submit(self._ping_worker)
+        self._ping_quiet = quiet
+        if not quiet:
+            self._set_status("Connecting...")
+            self._draw_dot(YELLOW)
+
+    def _heartbeat(self) -> None:
+        """Periodic quiet ping over the shared keep-alive session."""
+        self._ping_async(quiet=True)
+        self.root.after(PING_INTERVAL_MS, self._heartbeat)
 
     def _ping_worker(self) -> None:
         try:
-            client = _get_client()
+            client = _cached_client()
             client.ping()
             self._client = client
-            self._connected = True
             self.root.after(0, self._ping_ok)
         except Exception as exc:
-            self._connected = False
             self.root.after(0, self._ping_fail, str(exc))
 
     def _ping_ok(self) -> None:
+        self._ping_in_flight = False
+        quiet = self._ping_quiet
+        was_connected = self._connected
+        self._connected = True
         self._draw_dot(GREEN)
-        self._status_label.configure(text="Connected")
-        self._log("Connected to Binance Futures Testnet", "success")
+        self._set_status("Connected")
+        # Heartbeats only log state changes
+        if not (quiet and was_connected):
+            self._log("Connected to Binance Futures Testnet", "success")
 
     def _ping_fail(self, err: str) -> None:
+        self._ping_in_flight = False
+        quiet = self._ping_quiet
+        was_connected = self._connected
+        self._connected = False
         self._draw_dot(RED)
-        self._status_label.configure(text="Disconnected")
-        self._log(f"Connection failed: {err}", "error")
+        self._set_status("Disconnected")
+        if not (quiet and not was_connected):
+            self._log(f"Connection failed: {err}", "error")
 
     # ------------------------------------------------------------------
     # Order submission
     # ------------------------------------------------------------------
 
     def _submit_order(self) -> None:
-        symbol = self._symbol_var.get().strip()
-        side = self._side_var.get()
-        order_type = self._type_var.get()
-        quantity = self._qty_var.get().strip()
-        price = self._price_var.get().strip() or None
+        symbol, quantity, price = (
+            var.get().strip() for var in (self._symbol_var, self._qty_var, self._price_var)
+        )
 
         # --- Validate ---
         try:
-            params = validate_order(symbol, side, order_type, quantity, price)
+            params = validate_order(
+                symbol, self._side_var.get(), self._type_var.get(), quantity, price or None
+            )
         except ValidationError as exc:
             self._log(f"Validation error — {exc}", "error")
+            # Make the log line visible before the modal opens; idle tasks
+            # only (redraw), never a full update() that would run events
+            self._flush_log()
+            self._log_text.update_idletasks()
             messagebox.showwarning("Validation Error", str(exc))
             return
 
-        # --- Confirm ---
+        # --- Confirm (non-blocking; submission continues in _do_submit) ---
+        self._confirm_order(params)
+
+    def _confirm_order(self, params) -> None:
+        """Format the order summary and open the confirmation dialog."""
         summary = (
             f"Symbol:   {params.symbol}\n"
             f"Side:       {params.side}\n"
@@ -391,10 +620,14 @@ class TradingBotGUI:
         )
         if params.price is not None:
             summary += f"\nPrice:      {params.price}"
-        if not messagebox.askokcancel("Confirm Order", f"Place this order?\n\n{summary}"):
-            self._log("Order cancelled by user.", "warn")
-            return
+        self._confirm_dialog(
+            "Confirm Order",
+            f"Place this order?\n\n{summary}",
+            on_confirm=lambda: self._do_submit(params),
+            on_cancel=lambda: self._log("Order cancelled by user.", "warn"),
+        )
 
+    def _do_submit(self, params) -> None:
         # --- Submit in background ---
         self._set_busy(True)
         self._log(
@@ -403,11 +636,14 @@ class TradingBotGUI:
             + (f" price={params.price}" if params.price else ""),
             "info",
         )
-        threading.Thread(target=self._order_worker, args=(params,), daemon=True).start()
+        self._executor.submit(self._order_worker, params)
 
     def _order_worker(self, params) -> None:
+        from bot.client import BinanceAPIError
+        from bot.orders import place_order
+
         try:
-            client = self._client or _get_client()
+            client = self._client or _cached_client()
             response = place_order(client, params)
             self.root.after(0, self._order_ok, response)
         except BinanceAPIError as exc:
@@ -419,26 +655,15 @@ class TradingBotGUI:
         self._set_busy(False)
         self._log("Order placed successfully!", "success")
 
-        fields = [
-            ("Order ID", "orderId"),
-            ("Status", "status"),
-            ("Symbol", "symbol"),
-            ("Side", "side"),
-            ("Type", "type"),
-            ("Orig Qty", "origQty"),
-            ("Executed Qty", "executedQty"),
-            ("Avg Price", "avgPrice"),
-            ("Time In Force", "timeInForce"),
-        ]
-        for label, key in fields:
+        for label, key in self._ORDER_FIELDS:
             val = resp.get(key)
             if val is not None:
                 tag = "value"
                 if key == "status":
-                    tag = "success" if val in ("NEW", "FILLED", "PARTIALLY_FILLED") else "warn"
+                    tag = "success" if val in self._GOOD_STATUSES else "warn"
                 self._log_kv(label, str(val), tag)
 
-        self._log("—" * 50, "info")
+        self._log(self._SEPARATOR, "info")
 
     def _order_fail(self, err: str) -> None:
         self._set_busy(False)
@@ -452,6 +677,7 @@ class TradingBotGUI:
 
 
 def main() -> None:
+    _init_env()
     root = tk.Tk()
     TradingBotGUI(root)
     root.mainloop()